@@ -4,9 +4,11 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from lxml import etree
+
 from pptx.enum.shapes import MSO_CONNECTOR_TYPE
 from pptx.oxml import parse_xml
-from pptx.oxml.ns import nsdecls, qn
+from pptx.oxml.ns import _nsmap, nsdecls, qn
 from pptx.oxml.shapes.autoshape import CT_Shape
 from pptx.oxml.shapes.connector import CT_Connector
 from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
@@ -34,6 +36,13 @@ class CT_GroupShape(BaseShapeElement):
         qn("p:contentPart"),
     )
 
+    # ---these document-wide scans run on each shape added, so the expressions are
+    #    compiled once rather than re-parsed on every call to `.xpath()`---
+    _id_xpath = etree.XPath("//@id", smart_strings=False)
+    _shape_name_xpath = etree.XPath(
+        "//p:cNvPr/@name", namespaces=_nsmap, smart_strings=False
+    )
+
     def add_autoshape(self, id_, name, prst, x, y, cx, cy):
         """
         Append a new ``<p:sp>`` shape to the group/shapetree having the
@@ -141,9 +150,10 @@ class CT_GroupShape(BaseShapeElement):
         Generate each child of this ``<p:spTree>`` element that corresponds
         to a shape, in the sequence they appear in the XML.
         """
-        for elm in self.iterchildren():
-            if elm.tag in self._shape_tags:
-                yield elm
+        # ---lxml does the tag filtering, so non-shape children like `p:nvGrpSpPr`
+        #    and `p:grpSpPr` are never round-tripped into Python---
+        for elm in self.iterchildren(*self._shape_tags):
+            yield elm
 
     @property
     def max_shape_id(self):
@@ -156,10 +166,19 @@ class CT_GroupShape(BaseShapeElement):
         In practice, its minimum value is 1 because the spTree element itself
         is always assigned id="1".
         """
-        id_str_lst = self.xpath("//@id")
+        id_str_lst = self._id_xpath(self)
         used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
         return max(used_ids) if used_ids else 0
 
+    @property
+    def shape_names(self):
+        """List of str shape-name values used anywhere in this document.
+
+        Like shape ids, shape names are unique within a slide rather than within
+        a particular shape tree, so names of shapes in a group are included.
+        """
+        return self._shape_name_xpath(self)
+
     @classmethod
     def new_grpSp(cls, id_, name):
         """Return new "loose" `p:grpSp` element having *id_* and *name*."""
@@ -242,11 +261,12 @@ class CT_GroupShape(BaseShapeElement):
         numbering. In practice, the minimum id is 2 because the spTree
         element itself is always assigned id="1".
         """
-        id_str_lst = self.xpath("//@id")
-        used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
-        for n in range(1, len(used_ids) + 2):
-            if n not in used_ids:
-                return n
+        id_str_lst = self._id_xpath(self)
+        used_ids = set(int(id_str) for id_str in id_str_lst if id_str.isdigit())
+        next_id = 1
+        while next_id in used_ids:
+            next_id += 1
+        return next_id
 
 
 class CT_GroupShapeNonVisual(BaseShapeElement):
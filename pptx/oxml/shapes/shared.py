@@ -4,9 +4,11 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from lxml import etree
+
 from pptx.dml.fill import CT_GradientFillProperties
 from pptx.enum.shapes import PP_PLACEHOLDER
-from pptx.oxml.ns import qn
+from pptx.oxml.ns import _nsmap, qn
 from pptx.oxml.simpletypes import (
     ST_Angle,
     ST_Coordinate,
@@ -37,6 +39,10 @@ class BaseShapeElement(BaseOxmlElement):
     CT_Picture, etc.
     """
 
+    # ---placeholder status is checked for nearly every shape access (factories,
+    #    placeholder collections, title lookup), so compile this just once---
+    _ph_xpath = etree.XPath("./*[1]/p:nvPr/p:ph", namespaces=_nsmap)
+
     @property
     def cx(self):
         return self._get_xfrm_attr("cx")
@@ -90,7 +96,7 @@ class BaseShapeElement(BaseOxmlElement):
         """
         The ``<p:ph>`` descendant element if there is one, None otherwise.
         """
-        ph_elms = self.xpath("./*[1]/p:nvPr/p:ph")
+        ph_elms = self._ph_xpath(self)
         if len(ph_elms) == 0:
             return None
         return ph_elms[0]
@@ -213,7 +219,9 @@ class BaseShapeElement(BaseOxmlElement):
         name depends on the shape type, e.g. ``<p:nvPicPr>`` for picture
         shape.
         """
-        return self.xpath("./*[1]")[0]
+        # ---it is always the first child element, so take that directly rather
+        #    than evaluating an XPath expression for every id or name lookup---
+        return next(self.iterchildren("*"))
 
     def _get_xfrm_attr(self, name):
         xfrm = self.xfrm
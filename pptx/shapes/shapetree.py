@@ -3,6 +3,7 @@
 """The shape tree, the structure that holds a slide's shapes."""
 
 import os
+from itertools import islice
 
 from pptx.compat import BytesIO
 from pptx.enum.shapes import PP_PLACEHOLDER, PROG_ID
@@ -68,15 +69,21 @@ class _BaseShapes(ParentedElementProxy):
         super(_BaseShapes, self).__init__(spTree, parent)
         self._spTree = spTree
         self._cached_max_shape_id = None
+        self._cached_shape_names = None
 
     def __getitem__(self, idx):
         """
         Return shape at *idx* in sequence, e.g. ``shapes[2]``.
         """
-        shape_elms = list(self._iter_member_elms())
+        # ---a non-negative index only needs the shape elements up to that one, so
+        #    stop there rather than collecting (and testing) every shape element---
+        shape_elms = self._iter_member_elms()
         try:
-            shape_elm = shape_elms[idx]
-        except IndexError:
+            if idx < 0:
+                shape_elm = list(shape_elms)[idx]
+            else:
+                shape_elm = next(islice(shape_elms, idx, None))
+        except (IndexError, StopIteration):
             raise IndexError("shape index out of range")
         return self._shape_factory(shape_elm)
 
@@ -84,8 +91,10 @@ class _BaseShapes(ParentedElementProxy):
         """
         Generate a reference to each shape in the collection, in sequence.
         """
+        # ---bound once here rather than looked up on self for each shape---
+        shape_factory = self._shape_factory
         for shape_elm in self._iter_member_elms():
-            yield self._shape_factory(shape_elm)
+            yield shape_factory(shape_elm)
 
     def __len__(self):
         """
@@ -93,13 +102,13 @@ class _BaseShapes(ParentedElementProxy):
         1 to the total, without regard to the number of shapes contained in
         the group.
         """
-        shape_elms = list(self._iter_member_elms())
-        return len(shape_elms)
+        return sum(1 for _ in self._iter_member_elms())
 
     def clone_placeholder(self, placeholder):
         """Add a new placeholder shape based on *placeholder*."""
-        sp = placeholder.element
-        ph_type, orient, sz, idx = (sp.ph_type, sp.ph_orient, sp.ph_sz, sp.ph_idx)
+        # ---read all four attributes from one `p:ph` lookup rather than one each---
+        ph = placeholder.element.ph
+        ph_type, orient, sz, idx = (ph.type, ph.orient, ph.sz, ph.idx)
         id_ = self._next_shape_id
         name = self._next_ph_name(ph_type, id_, orient)
         self._spTree.add_placeholder(id_, name, ph_type, orient, sz, idx)
@@ -137,7 +146,8 @@ class _BaseShapes(ParentedElementProxy):
         adding large numbers (hundreds of shapes) to a slide. It works by
         caching the last shape ID used and incrementing that value to assign
         the next shape id. This avoids repeatedly searching all shape ids in
-        the slide each time a new ID is required.
+        the slide each time a new ID is required. The shape names in use are
+        cached in the same way for naming cloned placeholders.
 
         Performance is not noticeably improved for a slide with a relatively
         small number of shapes, but because the search time rises with the
@@ -157,6 +167,7 @@ class _BaseShapes(ParentedElementProxy):
     def turbo_add_enabled(self, value):
         enable = bool(value)
         self._cached_max_shape_id = self._spTree.max_shape_id if enable else None
+        self._cached_shape_names = set(self._spTree.shape_names) if enable else None
 
     @staticmethod
     def _is_member_elm(shape_elm):
@@ -171,8 +182,9 @@ class _BaseShapes(ParentedElementProxy):
         Generate each child of the ``<p:spTree>`` element that corresponds to
         a shape, in the sequence they appear in the XML.
         """
+        is_member_elm = self._is_member_elm
         for shape_elm in self._spTree.iter_shape_elms():
-            if self._is_member_elm(shape_elm):
+            if is_member_elm(shape_elm):
                 yield shape_elm
 
     def _next_ph_name(self, ph_type, id, orient):
@@ -191,15 +203,20 @@ class _BaseShapes(ParentedElementProxy):
         if orient == ST_Direction.VERT:
             basename = "Vertical %s" % basename
 
+        # ---presence of cached-shape-names indicates turbo mode is on---
+        cached_names = self._cached_shape_names
+        names = set(self._spTree.shape_names) if cached_names is None else cached_names
+
         # increment numpart as necessary to make name unique
         numpart = id - 1
-        names = self._spTree.xpath("//p:cNvPr/@name")
         while True:
             name = "%s %d" % (basename, numpart)
             if name not in names:
                 break
             numpart += 1
 
+        if cached_names is not None:
+            cached_names.add(name)
         return name
 
     @property
@@ -248,7 +265,7 @@ class _BaseGroupShapes(_BaseShapes):
         rId = self.part.add_chart_part(chart_type, chart_data)
         graphicFrame = self._add_chart_graphicFrame(rId, x, y, cx, cy)
         self._recalculate_extents()
-        return self._shape_factory(graphicFrame)
+        return self._register_new_shape(graphicFrame)
 
     def add_connector(self, connector_type, begin_x, begin_y, end_x, end_y):
         """Add a newly created connector shape to the end of this shape tree.
@@ -260,7 +277,7 @@ class _BaseGroupShapes(_BaseShapes):
         """
         cxnSp = self._add_cxnSp(connector_type, begin_x, begin_y, end_x, end_y)
         self._recalculate_extents()
-        return self._shape_factory(cxnSp)
+        return self._register_new_shape(cxnSp)
 
     def add_group_shape(self, shapes=[]):
         """Return a |GroupShape| object newly appended to this shape tree.
@@ -276,7 +293,7 @@ class _BaseGroupShapes(_BaseShapes):
             grpSp.insert_element_before(shape._element, "p:extLst")
         if shapes:
             grpSp.recalculate_extents()
-        return self._shape_factory(grpSp)
+        return self._register_new_shape(grpSp)
 
     def add_ole_object(
         self,
@@ -335,7 +352,7 @@ class _BaseGroupShapes(_BaseShapes):
         )
         self._spTree.append(graphicFrame)
         self._recalculate_extents()
-        return self._shape_factory(graphicFrame)
+        return self._register_new_shape(graphicFrame)
 
     def add_picture(self, image_file, left, top, width=None, height=None):
         """Add picture shape displaying image in *image_file*.
@@ -351,7 +368,7 @@ class _BaseGroupShapes(_BaseShapes):
         image_part, rId = self.part.get_or_add_image_part(image_file)
         pic = self._add_pic_from_image_part(image_part, rId, left, top, width, height)
         self._recalculate_extents()
-        return self._shape_factory(pic)
+        return self._register_new_shape(pic)
 
     def add_shape(self, autoshape_type_id, left, top, width, height):
         """Return new |Shape| object appended to this shape tree.
@@ -363,7 +380,7 @@ class _BaseGroupShapes(_BaseShapes):
         autoshape_type = AutoShapeType(autoshape_type_id)
         sp = self._add_sp(autoshape_type, left, top, width, height)
         self._recalculate_extents()
-        return self._shape_factory(sp)
+        return self._register_new_shape(sp)
 
     def add_textbox(self, left, top, width, height):
         """Return newly added text box shape appended to this shape tree.
@@ -373,7 +390,7 @@ class _BaseGroupShapes(_BaseShapes):
         """
         sp = self._add_textbox_sp(left, top, width, height)
         self._recalculate_extents()
-        return self._shape_factory(sp)
+        return self._register_new_shape(sp)
 
     def build_freeform(self, start_x=0, start_y=0, scale=1.0):
         """Return |FreeformBuilder| object to specify a freeform shape.
@@ -487,6 +504,17 @@ class _BaseGroupShapes(_BaseShapes):
         #    produce the distinctive behavior of groups and subgroups.---
         pass
 
+    def _register_new_shape(self, shape_elm):
+        """Return shape proxy for *shape_elm*, just added to this shape tree.
+
+        All the `add_*()` methods return through here so bookkeeping for a new
+        shape happens in one place. Currently that is recording its name when
+        turbo-add is enabled, so :meth:`_next_ph_name` sees every name in use.
+        """
+        if self._cached_shape_names is not None:
+            self._cached_shape_names.add(shape_elm.shape_name)
+        return self._shape_factory(shape_elm)
+
 
 class GroupShapes(_BaseGroupShapes):
     """The sequence of child shapes belonging to a group shape.
@@ -553,7 +581,7 @@ class SlideShapes(_BaseGroupShapes):
         )
         self._spTree.append(movie_pic)
         self._add_video_timing(movie_pic)
-        return self._shape_factory(movie_pic)
+        return self._register_new_shape(movie_pic)
 
     def add_table(self, rows, cols, left, top, width, height):
         """
@@ -567,8 +595,7 @@ class SlideShapes(_BaseGroupShapes):
         graphicFrame = self._add_graphicFrame_containing_table(
             rows, cols, left, top, width, height
         )
-        graphic_frame = self._shape_factory(graphicFrame)
-        return graphic_frame
+        return self._register_new_shape(graphicFrame)
 
     def clone_layout_placeholders(self, slide_layout):
         """
@@ -593,8 +620,11 @@ class SlideShapes(_BaseGroupShapes):
         The title placeholder shape on the slide or |None| if the slide has
         no title placeholder.
         """
-        for elm in self._spTree.iter_ph_elms():
-            if elm.ph_idx == 0:
+        # ---`p:ph` is located once per shape; `iter_ph_elms()` followed by
+        #    `.ph_idx` would locate it twice for each placeholder---
+        for elm in self._spTree.iter_shape_elms():
+            ph = elm.ph
+            if ph is not None and ph.idx == 0:
                 return self._shape_factory(elm)
         return None
 
@@ -714,9 +744,12 @@ class LayoutPlaceholders(BasePlaceholders):
         Return the first placeholder shape with matching *idx* value, or
         *default* if not found.
         """
-        for placeholder in self:
-            if placeholder.element.ph_idx == idx:
-                return placeholder
+        # ---match on the `p:ph` element itself and only construct a placeholder
+        #    shape for the match, not for each placeholder passed over---
+        for e in self._spTree.iter_shape_elms():
+            ph = e.ph
+            if ph is not None and ph.idx == idx:
+                return self._shape_factory(e)
         return default
 
     def _shape_factory(self, shape_elm):
@@ -739,9 +772,11 @@ class MasterPlaceholders(BasePlaceholders):
         or *default* if no such placeholder shape is present in the
         collection.
         """
-        for placeholder in self:
-            if placeholder.ph_type == ph_type:
-                return placeholder
+        # ---match on the `p:ph` element itself, as in `LayoutPlaceholders.get()`---
+        for e in self._spTree.iter_shape_elms():
+            ph = e.ph
+            if ph is not None and ph.type == ph_type:
+                return self._shape_factory(e)
         return default
 
     def _shape_factory(self, shape_elm):
@@ -788,10 +823,15 @@ class SlidePlaceholders(ParentedElementProxy):
         """
         Generate placeholder shapes in `idx` order.
         """
-        ph_elms = sorted(
-            [e for e in self._element.iter_ph_elms()], key=lambda e: e.ph_idx
-        )
-        return (SlideShapeFactory(e, self) for e in ph_elms)
+        # ---locate each `p:ph` element just once, pairing its idx with the shape
+        #    element, rather than once to filter and again for each sort key---
+        idx_elm_pairs = []
+        for e in self._element.iter_shape_elms():
+            ph = e.ph
+            if ph is not None:
+                idx_elm_pairs.append((ph.idx, e))
+        idx_elm_pairs.sort(key=lambda pair: pair[0])
+        return (SlideShapeFactory(e, self) for _, e in idx_elm_pairs)
 
     def __len__(self):
         """
@@ -800,23 +840,34 @@ class SlidePlaceholders(ParentedElementProxy):
         return len(list(self._element.iter_ph_elms()))
 
 
+# ---shape-element tags used to dispatch in the shape factories below. Every shape
+#    access passes through a factory, so these are resolved once at import time
+#    rather than by a `qn()` call for each comparison. Keep it that way: no code
+#    in this module should call `qn()` per shape.---
+_cxnSp_tag = qn("p:cxnSp")
+_graphicFrame_tag = qn("p:graphicFrame")
+_grpSp_tag = qn("p:grpSp")
+_pic_tag = qn("p:pic")
+_sp_tag = qn("p:sp")
+
+
 def BaseShapeFactory(shape_elm, parent):
     """
     Return an instance of the appropriate shape proxy class for *shape_elm*.
     """
     tag = shape_elm.tag
 
-    if tag == qn("p:pic"):
+    if tag == _pic_tag:
         videoFiles = shape_elm.xpath("./p:nvPicPr/p:nvPr/a:videoFile")
         if videoFiles:
             return Movie(shape_elm, parent)
         return Picture(shape_elm, parent)
 
     shape_cls = {
-        qn("p:cxnSp"): Connector,
-        qn("p:grpSp"): GroupShape,
-        qn("p:sp"): Shape,
-        qn("p:graphicFrame"): GraphicFrame,
+        _cxnSp_tag: Connector,
+        _grpSp_tag: GroupShape,
+        _sp_tag: Shape,
+        _graphicFrame_tag: GraphicFrame,
     }.get(tag, BaseShape)
 
     return shape_cls(shape_elm, parent)
@@ -828,7 +879,7 @@ def _LayoutShapeFactory(shape_elm, parent):
     on a slide layout.
     """
     tag_name = shape_elm.tag
-    if tag_name == qn("p:sp") and shape_elm.has_ph_elm:
+    if tag_name == _sp_tag and shape_elm.has_ph_elm:
         return LayoutPlaceholder(shape_elm, parent)
     return BaseShapeFactory(shape_elm, parent)
 
@@ -839,7 +890,7 @@ def _MasterShapeFactory(shape_elm, parent):
     on a slide master.
     """
     tag_name = shape_elm.tag
-    if tag_name == qn("p:sp") and shape_elm.has_ph_elm:
+    if tag_name == _sp_tag and shape_elm.has_ph_elm:
         return MasterPlaceholder(shape_elm, parent)
     return BaseShapeFactory(shape_elm, parent)
 
@@ -850,7 +901,7 @@ def _NotesSlideShapeFactory(shape_elm, parent):
     on a notes slide.
     """
     tag_name = shape_elm.tag
-    if tag_name == qn("p:sp") and shape_elm.has_ph_elm:
+    if tag_name == _sp_tag and shape_elm.has_ph_elm:
         return NotesSlidePlaceholder(shape_elm, parent)
     return BaseShapeFactory(shape_elm, parent)
 
@@ -860,16 +911,16 @@ def _SlidePlaceholderFactory(shape_elm, parent):
     Return a placeholder shape of the appropriate type for *shape_elm*.
     """
     tag = shape_elm.tag
-    if tag == qn("p:sp"):
+    if tag == _sp_tag:
         Constructor = {
             PP_PLACEHOLDER.BITMAP: PicturePlaceholder,
             PP_PLACEHOLDER.CHART: ChartPlaceholder,
             PP_PLACEHOLDER.PICTURE: PicturePlaceholder,
             PP_PLACEHOLDER.TABLE: TablePlaceholder,
         }.get(shape_elm.ph_type, SlidePlaceholder)
-    elif tag == qn("p:graphicFrame"):
+    elif tag == _graphicFrame_tag:
         Constructor = PlaceholderGraphicFrame
-    elif tag == qn("p:pic"):
+    elif tag == _pic_tag:
         Constructor = PlaceholderPicture
     else:
         Constructor = BaseShapeFactory
@@ -96,6 +96,32 @@ class DescribeCT_GroupShape(object):
         x, y, cx, cy = xSp._child_extents
         assert (x, y, cx, cy) == expected_values
 
+    def it_knows_the_shape_names_used_in_its_document(self):
+        spTree = element(
+            "p:spTree/(p:sp/p:nvSpPr/p:cNvPr{name=Title 1},p:grpSp/(p:nvGrpSpPr/p:cNv"
+            "Pr{name=Group 2},p:sp/p:nvSpPr/p:cNvPr{name=Oval 3}))"
+        )
+        grpSp = spTree.xpath("p:grpSp")[0]
+
+        assert spTree.shape_names == ["Title 1", "Group 2", "Oval 3"]
+        assert grpSp.shape_names == ["Title 1", "Group 2", "Oval 3"]
+
+    @pytest.mark.parametrize(
+        ("spTree_cxml", "expected_value"),
+        (
+            ("p:spTree", 1),
+            ("p:spTree{id=1}", 2),
+            ("p:spTree{id=1}/(p:sp{id=2},p:sp{id=4})", 3),
+            ("p:spTree{id=1}/(p:sp{id=3},p:sp{id=2},p:sp{id=foo})", 4),
+            ("p:spTree{id=2}/(p:sp{id=2},p:sp{id=3})", 1),
+        ),
+    )
+    def it_finds_the_next_available_shape_id_to_help(
+        self, spTree_cxml, expected_value
+    ):
+        spTree = element(spTree_cxml)
+        assert spTree._next_shape_id == expected_value
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -128,10 +128,20 @@ class Describe_BaseShapes(object):
         BaseShapeFactory_.assert_called_once_with(sp, shapes)
         assert shape is shape_
 
-    def it_raises_on_shape_index_out_of_range(self, getitem_raises_fixture):
+    def it_supports_indexed_access_from_the_end(self, BaseShapeFactory_, shape_):
+        spTree = element("p:spTree/(p:sp,p:sp)")
+        shapes = _BaseShapes(spTree, None)
+
+        shape = shapes[-2]
+
+        BaseShapeFactory_.assert_called_once_with(spTree[0], shapes)
+        assert shape is shape_
+
+    @pytest.mark.parametrize("idx", (2, -3))
+    def it_raises_on_shape_index_out_of_range(self, getitem_raises_fixture, idx):
         shapes = getitem_raises_fixture
         with pytest.raises(IndexError):
-            shapes[2]
+            shapes[idx]
 
     def it_can_clone_a_placeholder(self, clone_ph_fixture):
         shapes, placeholder_, expected_xml = clone_ph_fixture
@@ -156,6 +166,19 @@ class Describe_BaseShapes(object):
         shapes, ph_type, sp_id, orient, expected_value = ph_name_fixture
         assert shapes._next_ph_name(ph_type, sp_id, orient) == expected_value
 
+    def it_uses_cached_shape_names_in_turbo_mode(self):
+        spTree = element("p:spTree/p:cNvPr{name=Title 1}")
+        shapes = SlideShapes(spTree, None)
+        shapes.turbo_add_enabled = True
+        spTree.append(element("p:cNvPr{name=Title 2}"))
+
+        name = shapes._next_ph_name(PP_PLACEHOLDER.TITLE, 2, ST_Direction.HORZ)
+        next_name = shapes._next_ph_name(PP_PLACEHOLDER.TITLE, 2, ST_Direction.HORZ)
+
+        assert name == "Title 2"
+        assert next_name == "Title 3"
+        assert shapes._cached_shape_names == {"Title 1", "Title 2", "Title 3"}
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -493,6 +516,24 @@ class Describe_BaseGroupShapes(object):
         assert shapes._element.xml == expected_xml
         assert sp is shapes._element.xpath("p:sp")[0]
 
+    @pytest.mark.parametrize("turbo_add_enabled", (True, False))
+    def it_registers_a_newly_added_shape_to_help(
+        self, turbo_add_enabled, _shape_factory_, shape_
+    ):
+        spTree = element("p:spTree/p:sp/p:nvSpPr/p:cNvPr{id=2,name=Title 1}")
+        shapes = _BaseGroupShapes(spTree, None)
+        shapes.turbo_add_enabled = turbo_add_enabled
+        sp = element("p:sp/p:nvSpPr/p:cNvPr{id=3,name=TextBox 2}")
+        _shape_factory_.return_value = shape_
+
+        shape = shapes._register_new_shape(sp)
+
+        _shape_factory_.assert_called_once_with(shapes, sp)
+        assert shape is shape_
+        assert shapes._cached_shape_names == (
+            {"Title 1", "TextBox 2"} if turbo_add_enabled else None
+        )
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -1567,8 +1608,12 @@ class DescribeLayoutPlaceholders(object):
         assert placeholder is placeholder_
 
     def it_can_find_a_placeholder_by_idx_value(self, get_fixture):
-        placeholders, idx, placeholder_ = get_fixture
-        assert placeholders.get(idx) is placeholder_
+        placeholders, idx, sp, _LayoutShapeFactory_, placeholder_ = get_fixture
+
+        placeholder = placeholders.get(idx)
+
+        _LayoutShapeFactory_.assert_called_once_with(sp, placeholders)
+        assert placeholder is placeholder_
 
     def it_returns_default_on_ph_idx_not_found(self, default_fixture):
         placeholders, default = default_fixture
@@ -1577,8 +1622,11 @@ class DescribeLayoutPlaceholders(object):
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def default_fixture(self, _iter_):
-        placeholders = LayoutPlaceholders(None, None)
+    def default_fixture(self):
+        spTree = element(
+            "p:spTree/(p:sp,p:sp/p:nvSpPr/p:nvPr/p:ph{type=body,idx=1})"
+        )
+        placeholders = LayoutPlaceholders(spTree, None)
         default = "barfoo"
         return placeholders, default
 
@@ -1588,25 +1636,19 @@ class DescribeLayoutPlaceholders(object):
         sp = element("p:sp")
         return placeholders, sp, _LayoutShapeFactory_, placeholder_
 
-    @pytest.fixture(params=[0, 1])
-    def get_fixture(self, request, _iter_, placeholder_, placeholder_2_):
-        idx = request.param
-        layout_placeholders = LayoutPlaceholders(None, None)
-        _placeholder_ = (placeholder_, placeholder_2_)[idx]
-        placeholder_.element.ph_idx, placeholder_2_.element.ph_idx = 0, 1
-        return layout_placeholders, idx, _placeholder_
+    @pytest.fixture(params=[(0, 1), (1, 2)])
+    def get_fixture(self, request, _LayoutShapeFactory_, placeholder_):
+        idx, sp_idx = request.param
+        spTree = element(
+            "p:spTree/(p:sp,p:sp/p:nvSpPr/p:nvPr/p:ph{type=title},p:sp/p:nvSpPr/p:n"
+            "vPr/p:ph{type=body,idx=1})"
+        )
+        layout_placeholders = LayoutPlaceholders(spTree, None)
+        sp = spTree[sp_idx]
+        return layout_placeholders, idx, sp, _LayoutShapeFactory_, placeholder_
 
     # fixture components ---------------------------------------------
 
-    @pytest.fixture
-    def _iter_(self, request, placeholder_, placeholder_2_):
-        return method_mock(
-            request,
-            LayoutPlaceholders,
-            "__iter__",
-            return_value=iter([placeholder_, placeholder_2_]),
-        )
-
     @pytest.fixture
     def _LayoutShapeFactory_(self, request, placeholder_):
         return function_mock(
@@ -1620,10 +1662,6 @@ class DescribeLayoutPlaceholders(object):
     def placeholder_(self, request):
         return instance_mock(request, LayoutPlaceholder)
 
-    @pytest.fixture
-    def placeholder_2_(self, request):
-        return instance_mock(request, LayoutPlaceholder)
-
 
 class Describe_MasterShapeFactory(object):
     def it_constructs_a_master_placeholder_for_a_shape_element(self, factory_fixture):
@@ -1727,8 +1765,12 @@ class DescribeMasterPlaceholders(object):
         assert placeholder is placeholder_
 
     def it_can_find_a_placeholder_by_type(self, get_fixture):
-        placeholders, ph_type, placeholder_ = get_fixture
-        assert placeholders.get(ph_type) is placeholder_
+        placeholders, ph_type, sp, _MasterShapeFactory_, placeholder_ = get_fixture
+
+        placeholder = placeholders.get(ph_type)
+
+        _MasterShapeFactory_.assert_called_once_with(sp, placeholders)
+        assert placeholder is placeholder_
 
     def it_returns_default_on_ph_type_not_found(self, default_fixture):
         placeholders, default = default_fixture
@@ -1737,8 +1779,9 @@ class DescribeMasterPlaceholders(object):
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def default_fixture(self, _iter_):
-        placeholders = MasterPlaceholders(None, None)
+    def default_fixture(self):
+        spTree = element("p:spTree/(p:sp,p:sp/p:nvSpPr/p:nvPr/p:ph{type=title})")
+        placeholders = MasterPlaceholders(spTree, None)
         default = "barfoo"
         return placeholders, default
 
@@ -1748,24 +1791,19 @@ class DescribeMasterPlaceholders(object):
         sp = element("p:sp")
         return placeholders, sp, _MasterShapeFactory_, placeholder_
 
-    @pytest.fixture(params=["title", "body"])
-    def get_fixture(self, request, _iter_, placeholder_, placeholder_2_):
-        ph_type = request.param
-        placeholders = MasterPlaceholders(None, None)
-        _placeholder_ = {"title": placeholder_, "body": placeholder_2_}[ph_type]
-        return placeholders, ph_type, _placeholder_
+    @pytest.fixture(params=[(PP_PLACEHOLDER.TITLE, 1), (PP_PLACEHOLDER.BODY, 2)])
+    def get_fixture(self, request, _MasterShapeFactory_, placeholder_):
+        ph_type, sp_idx = request.param
+        spTree = element(
+            "p:spTree/(p:sp,p:sp/p:nvSpPr/p:nvPr/p:ph{type=title},p:sp/p:nvSpPr/p:n"
+            "vPr/p:ph{type=body,idx=1})"
+        )
+        placeholders = MasterPlaceholders(spTree, None)
+        sp = spTree[sp_idx]
+        return placeholders, ph_type, sp, _MasterShapeFactory_, placeholder_
 
     # fixture components ---------------------------------------------
 
-    @pytest.fixture
-    def _iter_(self, request, placeholder_, placeholder_2_):
-        return method_mock(
-            request,
-            MasterPlaceholders,
-            "__iter__",
-            return_value=iter([placeholder_, placeholder_2_]),
-        )
-
     @pytest.fixture
     def _MasterShapeFactory_(self, request, placeholder_):
         return function_mock(
@@ -1777,11 +1815,7 @@ class DescribeMasterPlaceholders(object):
 
     @pytest.fixture
     def placeholder_(self, request):
-        return instance_mock(request, MasterPlaceholder, ph_type="title")
-
-    @pytest.fixture
-    def placeholder_2_(self, request):
-        return instance_mock(request, MasterPlaceholder, ph_type="body")
+        return instance_mock(request, MasterPlaceholder)
 
 
 class Describe_MoviePicElementCreator(object):